@@ -10,7 +10,6 @@ from src.utils.logger_setup import logger, print_and_log
 from .constants import Messages
 from .display_formatter import DisplayFormatter
 from src.trade_confirmation_manager import TradeConfirmationManager
-from src.steampy.confirmation import ConfirmationExecutor
 from src.utils.confirmation_utils import determine_confirmation_type_from_json, extract_confirmation_info
 from src.steampy.confirmation import Confirmation
 
@@ -97,12 +96,7 @@ class MarketHandler:
             logger.info(f"🔧 DEBUG: steam_client.steam_id = {steam_client.steam_id}")
             logger.info(f"🔧 DEBUG: steam_client._session = {type(steam_client._session)}")
             
-            # Создаем executor для подтверждений
-            confirmation_executor = ConfirmationExecutor(
-                identity_secret=steam_client.steam_guard['identity_secret'],
-                my_steam_id=steam_client.steam_id,
-                session=steam_client._session
-            )
+            confirmation_executor = steam_client.confirmation_executor()
             
             logger.info("🔧 DEBUG: ConfirmationExecutor создан, получаем страницу подтверждений...")
             
@@ -191,14 +185,7 @@ class MarketHandler:
     def _confirm_market_order(self, steam_client, confirmation_data: dict) -> bool:
         """Подтвердить отдельный market ордер"""
         try:
-            from src.steampy.confirmation import ConfirmationExecutor
-            
-            # Создаем executor для подтверждений
-            confirmation_executor = ConfirmationExecutor(
-                identity_secret=steam_client.steam_guard['identity_secret'],
-                my_steam_id=steam_client.steam_id,
-                session=steam_client._session
-            )
+            confirmation_executor = steam_client.confirmation_executor()
             
             # Получаем объект подтверждения
             confirmation = confirmation_data['confirmation']
@@ -10,10 +10,10 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, Optional, Any
 from src.utils.logger_setup import logger
-from src.steampy.client import SteamClient
+from src.steampy.client import SteamClient, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
 from src.interfaces.storage_interface import CookieStorageInterface as StorageInterface
 from src.utils.delayed_http_adapter import DelayedHTTPAdapter
-from src.utils.cookies_and_session import session_to_dict
+from src.utils.cookies_and_session import SESSION_FILE_SUFFIX, session_to_dict
 from src.utils.logger_setup import print_and_log
 
 
@@ -43,7 +43,7 @@ class CookieManager:
         # Папка для сессий steampy
         self.accounts_dir = Path(accounts_dir)
         self.accounts_dir.mkdir(exist_ok=True)
-        self.session_file = self.accounts_dir / f"{username}.pkl"
+        self.session_file = self.accounts_dir / f"{username}{SESSION_FILE_SUFFIX}"
         
         # Состояние
         self.steam_client: Optional[SteamClient] = None
@@ -66,7 +66,10 @@ class CookieManager:
 
         # И здесь же монтируем адаптер, если это необходимо
         if request_delay_sec > 0:
-            adapter = DelayedHTTPAdapter(delay=request_delay_sec)
+            # Размер пула как у адаптера SteamClient по умолчанию, иначе keep-alive ограничен 10 соединениями
+            adapter = DelayedHTTPAdapter(
+                delay=request_delay_sec, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+            )
             self.client._session.mount('http://', adapter)
             self.client._session.mount('https://', adapter)
             logger.debug(f"Для клиента '{username}' установлен HTTP/S адаптер с задержкой {request_delay_sec:.2f} сек.")
@@ -109,7 +112,9 @@ class CookieManager:
 
             # Устанавливаем HTTP адаптер с задержкой если она настроена
             if hasattr(self, 'request_delay_sec') and self.request_delay_sec > 0:
-                adapter = DelayedHTTPAdapter(delay=self.request_delay_sec)
+                adapter = DelayedHTTPAdapter(
+                    delay=self.request_delay_sec, pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE,
+                )
                 steam_client._session.mount('http://', adapter)
                 steam_client._session.mount('https://', adapter)
                 logger.debug(f"Для нового Steam клиента '{self.username}' установлен HTTP адаптер с задержкой {self.request_delay_sec:.2f} сек.")
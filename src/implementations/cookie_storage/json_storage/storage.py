@@ -31,8 +31,9 @@ class JsonCookieStorage(CookieStorageInterface):
                 "last_update": datetime.now().isoformat()
             }
             
+            # Файл перезаписывается при каждом сохранении сессии - пишем компактно, без отступов
             with open(self.storage_dir / f"{username}_cookies.json", 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
             
             return True
         except Exception as e:
@@ -9,7 +9,11 @@ class JsonProxyProvider(ProxyProviderInterface):
     def __init__(self, **kwargs):
         # Всегда используем фиксированный путь для этой реализации
         self.json_path = Path('src/implementations/json_proxy/proxies.json')
-        self._proxies = self._load_proxies()
+        # Строки прокси разбираются один раз при загрузке, get_proxy - только поиск в словаре
+        self._proxies = {
+            account_name: self._parse_proxy(proxy_url)
+            for account_name, proxy_url in self._load_proxies().items()
+        }
 
     def _load_proxies(self) -> Dict[str, str]:
         if not self.json_path.exists():
@@ -17,33 +21,30 @@ class JsonProxyProvider(ProxyProviderInterface):
         with open(self.json_path, 'r') as f:
             return json.load(f)
 
-    def get_proxy(self, account_name: str) -> Optional[Dict[str, str]]:
-        proxy_url = self._proxies.get(account_name)
-
+    @staticmethod
+    def _parse_proxy(proxy_url: Optional[str]) -> Optional[Dict[str, str]]:
         if not proxy_url or proxy_url.lower() == 'no_proxy':
             return None
 
         # Конвертируем формат host:port:username:password в username:password@host:port
-        if ':' in proxy_url and proxy_url.count(':') >= 3:
-            # Парсим формат "http://host:port:username:password"
-            if proxy_url.startswith('http://'):
-                proxy_url = proxy_url[7:]  # убираем http://
-            
-            parts = proxy_url.split(':')
-            if len(parts) >= 4:
-                host = parts[0]
-                port = parts[1]
-                username = parts[2]
-                password = parts[3]
-                formatted_proxy = f"http://{username}:{password}@{host}:{port}"
-                
-                return {
-                    'http': formatted_proxy,
-                    'https': formatted_proxy
-                }
+        # Парсим формат "http://host:port:username:password"
+        address = proxy_url[7:] if proxy_url.startswith('http://') else proxy_url  # убираем http://
+
+        # Ограничиваем разбиение: всё после третьего ':' считается паролем
+        parts = address.split(':', 3)
+        if len(parts) == 4:
+            host, port, username, password = parts
+            formatted_proxy = f"http://{username}:{password}@{host}:{port}"
+            return {
+                'http': formatted_proxy,
+                'https': formatted_proxy
+            }
 
         # Если уже в правильном формате, используем как есть
         return {
             'http': proxy_url,
             'https': proxy_url
-        } 
\ No newline at end of file
+        }
+
+    def get_proxy(self, account_name: str) -> Optional[Dict[str, str]]:
+        return self._proxies.get(account_name)
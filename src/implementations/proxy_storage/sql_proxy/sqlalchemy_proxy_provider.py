@@ -127,28 +127,25 @@ class SqlAlchemyProxyProvider(ProxyProviderInterface):
                 return None
 
             # --- Авто-конвертация формата host:port:username:password в username:password@host:port ---
-            if ':' in proxy_data and proxy_data.count(':') >= 3:
-                # Парсим формат "http://host:port:username:password"
-                if proxy_data.startswith('http://'):
-                    proxy_data_ = proxy_data[7:]
-                    prefix = 'http://'
-                elif proxy_data.startswith('https://'):
-                    proxy_data_ = proxy_data[8:]
-                    prefix = 'https://'
-                else:
-                    proxy_data_ = proxy_data
-                    prefix = 'http://'
-                parts = proxy_data_.split(':')
-                if len(parts) >= 4:
-                    host = parts[0]
-                    port = parts[1]
-                    username = parts[2]
-                    password = parts[3]
-                    formatted_proxy = f"{prefix}{username}:{password}@{host}:{port}"
-                    return {
-                        'http': formatted_proxy,
-                        'https': formatted_proxy
-                    }
+            # Парсим формат "http://host:port:username:password"
+            if proxy_data.startswith('http://'):
+                proxy_data_ = proxy_data[7:]
+                prefix = 'http://'
+            elif proxy_data.startswith('https://'):
+                proxy_data_ = proxy_data[8:]
+                prefix = 'https://'
+            else:
+                proxy_data_ = proxy_data
+                prefix = 'http://'
+            # Ограничиваем разбиение: всё после третьего ':' считается паролем
+            parts = proxy_data_.split(':', 3)
+            if len(parts) == 4:
+                host, port, username, password = parts
+                formatted_proxy = f"{prefix}{username}:{password}@{host}:{port}"
+                return {
+                    'http': formatted_proxy,
+                    'https': formatted_proxy
+                }
 
             # Если уже в правильном формате, используем как есть
             return {
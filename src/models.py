@@ -2,8 +2,9 @@
 Pydantic модели для Steam API ответов
 """
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+from typing import List, Optional, Dict, Any, Tuple
+from functools import cached_property
+from pydantic import BaseModel, ConfigDict, Field
 from enum import IntEnum
 from dataclasses import dataclass
 
@@ -17,12 +18,7 @@ class ConfirmationMethod(IntEnum):
     @property
     def display_name(self) -> str:
         """Человеко-читаемое название метода"""
-        names = {
-            0: "None",
-            1: "Email", 
-            2: "MobileApp"
-        }
-        return names.get(self.value, f"Unknown({self.value})")
+        return _CONFIRMATION_METHOD_NAMES.get(self.value, f"Unknown({self.value})")
 
 
 class TradeOfferState(IntEnum):
@@ -42,24 +38,36 @@ class TradeOfferState(IntEnum):
     @property
     def display_name(self) -> str:
         """Человеко-читаемое название состояния"""
-        names = {
-            1: "Invalid",
-            2: "Active", 
-            3: "Accepted",
-            4: "Countered",
-            5: "Expired",
-            6: "Canceled",
-            7: "Declined",
-            8: "InvalidItems",
-            9: "CreatedNeedsConfirmation",
-            10: "CanceledBySecondFactor",
-            11: "InEscrow"
-        }
-        return names.get(self.value, f"Unknown({self.value})")
+        return _TRADE_OFFER_STATE_NAMES.get(self.value, f"Unknown({self.value})")
+
+
+# Таблицы названий строятся один раз при импорте, а не на каждый вызов display_name
+_CONFIRMATION_METHOD_NAMES = {
+    0: "None",
+    1: "Email",
+    2: "MobileApp"
+}
+
+_TRADE_OFFER_STATE_NAMES = {
+    1: "Invalid",
+    2: "Active",
+    3: "Accepted",
+    4: "Countered",
+    5: "Expired",
+    6: "Canceled",
+    7: "Declined",
+    8: "InvalidItems",
+    9: "CreatedNeedsConfirmation",
+    10: "CanceledBySecondFactor",
+    11: "InEscrow"
+}
 
 
 class TradeItem(BaseModel):
     """Предмет в трейде"""
+    # Экземпляры только читаются после парсинга
+    model_config = ConfigDict(frozen=True)
+
     appid: int
     contextid: str
     assetid: str
@@ -72,13 +80,17 @@ class TradeItem(BaseModel):
 
 class TradeOffer(BaseModel):
     """Трейд оффер"""
+    model_config = ConfigDict(frozen=True)
+
     tradeofferid: str
     accountid_other: int
     message: Optional[str] = None
     expiration_time: Optional[int] = None
-    trade_offer_state: TradeOfferState
-    items_to_give: Optional[List[TradeItem]] = Field(default_factory=list)
-    items_to_receive: Optional[List[TradeItem]] = Field(default_factory=list)
+    # Храним сырое значение: без создания IntEnum на каждый оффер при парсинге
+    trade_offer_state: int
+    # Steam не присылает ключ, если предметов нет - не создаем пустые списки на каждый оффер
+    items_to_give: Optional[List[TradeItem]] = None
+    items_to_receive: Optional[List[TradeItem]] = None
     is_our_offer: bool
     time_created: int
     time_updated: int
@@ -92,7 +104,7 @@ class TradeOffer(BaseModel):
     @property
     def state_name(self) -> str:
         """Человеко-читаемое название состояния"""
-        return self.trade_offer_state.display_name
+        return _TRADE_OFFER_STATE_NAMES.get(self.trade_offer_state, f"Unknown({self.trade_offer_state})")
 
     @property
     def is_active(self) -> bool:
@@ -130,20 +142,17 @@ class TradeOffer(BaseModel):
     @property
     def items_to_give_count(self) -> int:
         """Количество предметов к отдаче"""
-        return len(self.items_to_give) if self.items_to_give else 0
+        return 0 if self.items_to_give is None else len(self.items_to_give)
 
     @property
     def items_to_receive_count(self) -> int:
         """Количество предметов к получению"""
-        return len(self.items_to_receive) if self.items_to_receive else 0
+        return 0 if self.items_to_receive is None else len(self.items_to_receive)
 
     @property
     def confirmation_method_name(self) -> str:
         """Название метода подтверждения"""
-        try:
-            return ConfirmationMethod(self.confirmation_method).display_name
-        except ValueError:
-            return f"Unknown({self.confirmation_method})"
+        return _CONFIRMATION_METHOD_NAMES.get(self.confirmation_method, f"Unknown({self.confirmation_method})")
 
     @property
     def is_incoming(self) -> bool:
@@ -163,6 +172,8 @@ class TradeOffer(BaseModel):
 
 class ItemDescription(BaseModel):
     """Описание предмета"""
+    model_config = ConfigDict(frozen=True)
+
     appid: int
     classid: str
     instanceid: str
@@ -186,42 +197,77 @@ class ItemDescription(BaseModel):
     tags: Optional[List[Dict[str, str]]] = Field(default_factory=list)
 
 
+def _classify_offers(offers: List[TradeOffer]) -> Tuple[List[TradeOffer], List[TradeOffer]]:
+    """Раскладывает офферы за один проход: (активные, требующие подтверждения)"""
+    active: List[TradeOffer] = []
+    confirmation_needed: List[TradeOffer] = []
+    for offer in offers:
+        if offer.is_active:
+            active.append(offer)
+        if offer.needs_confirmation:
+            confirmation_needed.append(offer)
+    return active, confirmation_needed
+
+
 class TradeOffersResponse(BaseModel):
     """Ответ API для получения трейд офферов"""
+    # Неизменяемая: раскладка офферов кэшируется и не должна расходиться с полями
+    model_config = ConfigDict(frozen=True)
+
     trade_offers_received: Optional[List[TradeOffer]] = Field(default_factory=list)
     trade_offers_sent: Optional[List[TradeOffer]] = Field(default_factory=list)
     descriptions: Optional[List[ItemDescription]] = Field(default_factory=list)
     next_cursor: Optional[int] = None
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TradeOffersResponse":
+        """Разбирает сырой ответ GetTradeOffers (с оберткой `response`) из байтов"""
+        return SteamApiTradeOffersResponse.model_validate_json(data).response
+
+    @cached_property
+    def _received_buckets(self) -> Tuple[List[TradeOffer], List[TradeOffer]]:
+        """Входящие офферы, разложенные по категориям (считается один раз)"""
+        return _classify_offers(self.trade_offers_received)
+
+    @cached_property
+    def _sent_buckets(self) -> Tuple[List[TradeOffer], List[TradeOffer]]:
+        """Исходящие офферы, разложенные по категориям (считается один раз)"""
+        return _classify_offers(self.trade_offers_sent)
+
     @property
     def active_received(self) -> List[TradeOffer]:
         """Активные входящие трейды"""
-        return [offer for offer in self.trade_offers_received if offer.is_active]
+        return self._received_buckets[0]
 
     @property
     def active_sent(self) -> List[TradeOffer]:
         """Активные исходящие трейды"""
-        return [offer for offer in self.trade_offers_sent if offer.is_active]
+        return self._sent_buckets[0]
 
     @property
     def confirmation_needed_received(self) -> List[TradeOffer]:
         """Входящие трейды, требующие подтверждения"""
-        return [offer for offer in self.trade_offers_received if offer.needs_confirmation]
+        return self._received_buckets[1]
 
     @property
     def confirmation_needed_sent(self) -> List[TradeOffer]:
         """Исходящие трейды, требующие подтверждения"""
-        return [offer for offer in self.trade_offers_sent if offer.needs_confirmation]
+        return self._sent_buckets[1]
+
+    @property
+    def any_active_received(self) -> bool:
+        """Есть ли хотя бы один активный входящий трейд (без раскладки всех офферов)"""
+        return any(offer.is_active for offer in self.trade_offers_received)
 
     @property
     def total_active_offers(self) -> int:
         """Общее количество активных офферов"""
-        return len(self.active_received) + len(self.active_sent)
+        return len(self._received_buckets[0]) + len(self._sent_buckets[0])
 
     @property
     def total_confirmation_needed(self) -> int:
         """Общее количество офферов, требующих подтверждения"""
-        return len(self.confirmation_needed_received) + len(self.confirmation_needed_sent)
+        return len(self._received_buckets[1]) + len(self._sent_buckets[1])
 
 
 @dataclass
@@ -245,4 +291,14 @@ class TradeOffersSummaryResponse(BaseModel):
 
 class SteamApiSummaryResponse(BaseModel):
     """Ответ API для сводки трейд офферов"""
-    response: TradeOffersSummaryResponse 
\ No newline at end of file
+    response: TradeOffersSummaryResponse
+
+
+class SteamApiTradeOffersResponse(BaseModel):
+    """Ответ API GetTradeOffers (обертка `response`)
+
+    Разбирается напрямую из байтов ответа через `model_validate_json`:
+    парсинг JSON и валидация выполняются в pydantic-core за один проход,
+    без промежуточного dict из `response.json()`.
+    """
+    response: TradeOffersResponse = Field(default_factory=TradeOffersResponse)
@@ -25,6 +25,7 @@ from .utils.cookies_and_session import session_to_dict, extract_cookies_for_doma
 from .cli.account_context import AccountContext
 from .steampy.client import SteamClient
 from .steampy.confirmation import ConfirmationExecutor, Confirmation
+from .steampy.utils import page_contains_username
 
 from .utils.logger_setup import logger
 
@@ -379,7 +380,7 @@ class PasswordChanger:
             print_and_log(f"🔍 URL ответа: {response.url}")
             print_and_log(f"🔍 История редиректов: {len(response.history)} редиректов")
             
-            if self.username.lower() in response.text.lower():
+            if page_contains_username(response.content, self.username):
                 print(f"✅ {self.username} найден в тексте - АВТОРИЗОВАН")
             else:
                 print(f"❌ {self.username} НЕ найден в тексте - НЕ АВТОРИЗОВАН")
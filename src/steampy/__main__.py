@@ -4,55 +4,73 @@
 """
 
 import sys
-import argparse
+from importlib import import_module
+
+# Имя модуля -> "относительный.модуль:функция"; модуль импортируется только при запуске
+MODULES = {
+    'session-manager': '.session_manager:main',
+}
+
+
+def _create_parser():
+    """Парсер нужен только для вывода справки, поэтому собирается по требованию"""
+    import argparse
 
-def main():
-    """Главная функция для запуска модулей"""
-    
     parser = argparse.ArgumentParser(
+        prog='python -m steampy',
         description="SteamPy - Инструменты для работы с Steam API",
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog="""
 Доступные модули:
   session-manager    Управление Steam сессиями
-  
+
 Примеры:
   python -m steampy session-manager --username myuser --get-2fa
   python -m steampy session-manager --username myuser --monitor
         """
     )
-    
+
     parser.add_argument(
         'module',
-        choices=['session-manager'],
+        choices=list(MODULES),
         help='Модуль для запуска'
     )
-    
-    # Парсим только первый аргумент (имя модуля)
+    return parser
+
+
+def main():
+    """Главная функция для запуска модулей"""
+
     if len(sys.argv) < 2:
-        parser.print_help()
+        _create_parser().print_help()
         sys.exit(1)
-    
+
     module_name = sys.argv[1]
     module_args = sys.argv[2:]
-    
-    if module_name == 'session-manager':
-        from .session_manager import main as session_manager_main
-        
-        # Заменяем sys.argv для корректной работы argparse в модуле
-        original_argv = sys.argv
-        sys.argv = ['session_manager'] + module_args
-        
-        try:
-            session_manager_main()
-        finally:
-            sys.argv = original_argv
-    else:
+
+    if module_name in ('-h', '--help'):
+        _create_parser().print_help()
+        return
+
+    target = MODULES.get(module_name)
+    if target is None:
         from src.utils.logger_setup import logger
         logger.error(f"Неизвестный модуль: {module_name}")
         print(f"Неизвестный модуль: {module_name}")
-        parser.print_help()
+        _create_parser().print_help()
         sys.exit(1)
 
+    module_path, func_name = target.split(':')
+    module_main = getattr(import_module(module_path, __package__), func_name)
+
+    # Заменяем sys.argv для корректной работы argparse в модуле
+    original_argv = sys.argv
+    sys.argv = [module_name.replace('-', '_')] + module_args
+
+    try:
+        module_main()
+    finally:
+        sys.argv = original_argv
+
 if __name__ == "__main__":
-    main() 
+    main()
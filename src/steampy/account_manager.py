@@ -4,6 +4,9 @@ Steam Account Manager - Интегрированное управление ак
 """
 
 import asyncio
+import heapq
+import os
+import random
 from src.utils.logger_setup import logger
 import threading
 import time
@@ -11,14 +14,47 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Callable, Any
 import concurrent.futures
+from dataclasses import dataclass
 
-from .client import SteamClient
+from .client import SteamClient, build_http_adapter
 from .config import ConfigManager, AccountConfig
 from .session_manager import SecureSessionManager
 from .models import TradeOfferState, GameOptions
 from .exceptions import ApiException
 
 
+# Сколько проверок трейдов выполняется одновременно для всех аккаунтов
+IO_POOL_SIZE = 8
+# Максимальный сон планировщика (страховка; обычно его будит self._tasks_cond)
+SCHEDULER_MAX_SLEEP = 5.0
+# Размер постоянного пула для параллельных действий по всем аккаунтам
+FANOUT_POOL_SIZE = min(32, (os.cpu_count() or 4) * 4)
+# Во сколько раз интервал опроса простаивающего аккаунта может превысить seconds_to_check_trades
+MAX_POLL_INTERVAL_FACTOR = 16
+# Пауза после ошибки проверки трейдов: первая, предельная (секунды) и разброс, чтобы
+# аккаунты не повторяли запросы к Steam одновременно
+ERROR_BACKOFF_INITIAL = 30.0
+ERROR_BACKOFF_MAX = 300.0
+ERROR_BACKOFF_JITTER = 0.5
+# Состояние активного оффера как обычный int: сравнение без обращения к IntEnum
+_ACTIVE = int(TradeOfferState.Active)
+
+
+@dataclass(slots=True)
+class _AccountState:
+    """Состояние мониторинга трейдов одного аккаунта (одна запись вместо нескольких словарей)"""
+    config: AccountConfig
+    next_deadline: float = 0.0
+    # Текущий адаптивный интервал опроса
+    current_interval: float = 0.0
+    # Проверка сейчас выполняется в пуле
+    in_flight: bool = False
+    # Во время проверки запрошена внеочередная (trigger_check)
+    kick_pending: bool = False
+    # Пауза после последней ошибки (0 - ошибок подряд не было)
+    error_backoff: float = 0.0
+
+
 class AccountManager:
     """Менеджер для автоматизированного управления множественными Steam аккаунтами"""
     
@@ -32,8 +68,31 @@ class AccountManager:
         self.config_manager = config_manager
         self.session_managers: Dict[str, SecureSessionManager] = {}
         self.clients: Dict[str, SteamClient] = {}
-        self.running_tasks: Dict[str, threading.Thread] = {}
+        # Неизменяемый снимок clients для параллельных действий; пересобирается при входе/выходе
+        self._clients_lock = threading.Lock()
+        self._clients_snapshot: tuple = ()
+        # Аккаунты на мониторинге трейдов и состояние их опроса
+        self.running_tasks: Dict[str, _AccountState] = {}
         self.is_running = False
+        # Конфигурации аккаунтов для циклов опроса; сбрасываются через invalidate_config
+        self._config_cache: Dict[str, AccountConfig] = {}
+        # Сериализованные конфигурации для get_account_status
+        self._config_dict_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Один поток-планировщик на все аккаунты; сетевые вызовы идут в общий ограниченный пул
+        self._tasks_lock = threading.Lock()
+        # Будит планировщик: новая задача, перепланирование или остановка
+        self._tasks_cond = threading.Condition(self._tasks_lock)
+        # Куча (срок, аккаунт); записи, не совпадающие с running_tasks, считаются устаревшими
+        self._poll_heap: List[tuple] = []
+        self._scheduler_thread: Optional[threading.Thread] = None
+        self._io_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._fanout_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._fanout_lock = threading.Lock()
+        # Один HTTPAdapter на все клиенты: TCP/TLS соединения переиспользуются между аккаунтами.
+        # Cookies и прокси остаются в сессии каждого аккаунта (у адаптера свой пул на каждый прокси).
+        # Пул и политика повторов те же, что у адаптера SteamClient по умолчанию
+        self._shared_adapter = build_http_adapter()
         
         # Настройка логирования
         self.logger = self._setup_logging()
@@ -53,6 +112,7 @@ class AccountManager:
                 check_interval=config.seconds_to_check_session
             )
             self.session_managers[account_name] = session_manager
+            self._config_cache[account_name] = config
             
             # Получаем чувствительные данные и сохраняем их в session_manager
             password, api_key = self.config_manager.get_sensitive_data(account_name)
@@ -79,6 +139,7 @@ class AccountManager:
             check_interval=config.seconds_to_check_session
         )
         self.session_managers[account_name] = session_manager
+        self._config_cache[account_name] = config
         
         # Настройка credentials
         password, api_key = self.config_manager.get_sensitive_data(account_name)
@@ -87,6 +148,36 @@ class AccountManager:
         
         self.logger.info(f"Добавлен аккаунт: {account_name}")
     
+    def _get_config(self, account_name: str) -> AccountConfig:
+        """
+        Конфигурация аккаунта из кэша (при промахе - из config_manager)
+        
+        Args:
+            account_name: Имя аккаунта
+            
+        Returns:
+            Конфигурация аккаунта
+        """
+        config = self._config_cache.get(account_name)
+        if config is None:
+            config = self.config_manager.get_account(account_name)
+            self._config_cache[account_name] = config
+        return config
+    
+    def invalidate_config(self, account_name: Optional[str] = None) -> None:
+        """
+        Сброс кэшированной конфигурации после изменения в config_manager
+        
+        Args:
+            account_name: Имя аккаунта (None - сбросить все)
+        """
+        if account_name is None:
+            self._config_cache.clear()
+            self._config_dict_cache.clear()
+        else:
+            self._config_cache.pop(account_name, None)
+            self._config_dict_cache.pop(account_name, None)
+    
     def remove_account(self, account_name: str) -> None:
         """
         Удаление аккаунта из менеджера
@@ -98,10 +189,9 @@ class AccountManager:
         self._stop_account_tasks(account_name)
         
         # Удаляем из менеджеров
-        if account_name in self.session_managers:
-            del self.session_managers[account_name]
-        if account_name in self.clients:
-            del self.clients[account_name]
+        self.session_managers.pop(account_name, None)
+        self._drop_client(account_name)
+        self.invalidate_config(account_name)
         
         self.logger.info(f"Удален аккаунт: {account_name}")
     
@@ -116,17 +206,18 @@ class AccountManager:
         Returns:
             True если вход успешен
         """
-        if account_name not in self.session_managers:
+        try:
+            session_manager = self.session_managers[account_name]
+        except KeyError:
             self.logger.error(f"Аккаунт {account_name} не найден")
             return False
         
-        session_manager = self.session_managers[account_name]
-        
         try:
             if session_manager.login(force_refresh):
                 # Создаем Steam клиент
                 if session_manager.client:
-                    self.clients[account_name] = session_manager.client
+                    self._attach_shared_adapter(session_manager.client)
+                    self._set_client(account_name, session_manager.client)
                     self.logger.info(f"Успешный вход для {account_name}")
                     return True
             
@@ -136,6 +227,28 @@ class AccountManager:
             self.logger.error(f"Ошибка входа для {account_name}: {e}")
             return False
     
+    def _set_client(self, account_name: str, client: SteamClient) -> None:
+        """Регистрация клиента аккаунта и пересборка снимка"""
+        with self._clients_lock:
+            self.clients[account_name] = client
+            self._clients_snapshot = tuple(self.clients.items())
+    
+    def _drop_client(self, account_name: str) -> None:
+        """Удаление клиента аккаунта и пересборка снимка"""
+        with self._clients_lock:
+            if self.clients.pop(account_name, None) is not None:
+                self._clients_snapshot = tuple(self.clients.items())
+    
+    def _attach_shared_adapter(self, client: SteamClient) -> None:
+        """
+        Подключение общего пула соединений к сессии клиента
+        
+        Args:
+            client: Steam клиент аккаунта
+        """
+        for prefix in ('https://', 'http://'):
+            client._session.mount(prefix, self._shared_adapter)
+    
     def logout_account(self, account_name: str) -> None:
         """
         Выход из аккаунта
@@ -145,16 +258,18 @@ class AccountManager:
         """
         self._stop_account_tasks(account_name)
         
-        if account_name in self.session_managers:
-            self.session_managers[account_name].stop_monitoring()
+        session_manager = self.session_managers.get(account_name)
+        if session_manager is not None:
+            session_manager.stop_monitoring()
         
-        if account_name in self.clients:
+        client = self.clients.get(account_name)
+        if client is not None:
             try:
-                self.clients[account_name].logout()
+                client.logout()
             except Exception as e:
                 self.logger.error(f"Ошибка выхода для {account_name}: {e}")
             finally:
-                del self.clients[account_name]
+                self._drop_client(account_name)
         
         self.logger.info(f"Выход из аккаунта: {account_name}")
     
@@ -165,21 +280,22 @@ class AccountManager:
         Args:
             account_name: Имя аккаунта
         """
-        if account_name not in self.session_managers:
+        try:
+            session_manager = self.session_managers[account_name]
+        except KeyError:
             self.logger.error(f"Аккаунт {account_name} не найден")
             return
         
-        config = self.config_manager.get_account(account_name)
+        config = self._get_config(account_name)
         
         # Запускаем мониторинг сессии
-        session_manager = self.session_managers[account_name]
         session_manager.start_monitoring()
         
         # Запускаем мониторинг трейдов (если разрешено)
         if config.allowed_to_check_and_accept_new_trades:
             self._start_trade_monitoring(account_name)
         
-        self.logger.info(f"Запущен мониторинг для {account_name}")
+        self.logger.debug("Запущен мониторинг для {}", account_name)
     
     def stop_account_monitoring(self, account_name: str) -> None:
         """
@@ -190,10 +306,11 @@ class AccountManager:
         """
         self._stop_account_tasks(account_name)
         
-        if account_name in self.session_managers:
-            self.session_managers[account_name].stop_monitoring()
+        session_manager = self.session_managers.get(account_name)
+        if session_manager is not None:
+            session_manager.stop_monitoring()
         
-        self.logger.info(f"Остановлен мониторинг для {account_name}")
+        self.logger.debug("Остановлен мониторинг для {}", account_name)
     
     def _start_trade_monitoring(self, account_name: str) -> None:
         """
@@ -202,27 +319,162 @@ class AccountManager:
         Args:
             account_name: Имя аккаунта
         """
-        if account_name in self.running_tasks:
-            return  # Уже запущен
+        with self._tasks_cond:
+            if account_name in self.running_tasks:
+                return  # Уже запущен
+            
+            config = self._get_config(account_name)
+            state = _AccountState(config=config, current_interval=config.seconds_to_check_trades)
+            self.running_tasks[account_name] = state
+            
+            # Первая проверка - сразу
+            self._schedule_check(account_name, state, time.monotonic())
+            
+            if self._io_pool is None:
+                self._io_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=IO_POOL_SIZE, thread_name_prefix="trade_io"
+                )
+            
+            if self._scheduler_thread is None or not self._scheduler_thread.is_alive():
+                self._scheduler_thread = threading.Thread(
+                    target=self._trade_scheduler, name="trade_scheduler", daemon=True
+                )
+                self._scheduler_thread.start()
+            
+            self._tasks_cond.notify()
+    
+    def _get_fanout_pool(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Постоянный пул для perform_action_on_all (создается при первом обращении)"""
+        with self._fanout_lock:
+            if self._fanout_pool is None:
+                self._fanout_pool = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=FANOUT_POOL_SIZE, thread_name_prefix="acct_fanout"
+                )
+            return self._fanout_pool
+    
+    def _schedule_check(self, account_name: str, state: _AccountState, deadline: float) -> None:
+        """Назначает следующую проверку аккаунта (вызывать под _tasks_cond)"""
+        state.next_deadline = deadline
+        heapq.heappush(self._poll_heap, (deadline, account_name))
+    
+    def _trade_scheduler(self) -> None:
+        """Планировщик: за один тик отправляет в пул все аккаунты, у которых наступил срок"""
+        with self._tasks_cond:
+            while self.is_running:
+                now = time.monotonic()
+                
+                while self._poll_heap and self._poll_heap[0][0] <= now:
+                    deadline, account_name = heapq.heappop(self._poll_heap)
+                    state = self.running_tasks.get(account_name)
+                    # Аккаунт сняли с мониторинга или перепланировали
+                    if state is None or state.next_deadline != deadline or state.in_flight:
+                        continue
+                    state.in_flight = True
+                    self._io_pool.submit(self._run_trade_check, account_name, state)
+                
+                next_wake = now + SCHEDULER_MAX_SLEEP
+                if self._poll_heap:
+                    next_wake = min(next_wake, self._poll_heap[0][0])
+                
+                # Блокировка отпускается на время ожидания; любой notify пересчитывает срок
+                self._tasks_cond.wait(timeout=max(0.0, next_wake - time.monotonic()))
+    
+    def _run_trade_check(self, account_name: str, state: _AccountState) -> None:
+        """
+        Одна проверка трейдов аккаунта в потоке пула; планирует следующую
         
-        def trade_monitor():
-            config = self.config_manager.get_account(account_name)
+        Args:
+            account_name: Имя аккаунта
+            state: Состояние мониторинга аккаунта
+        """
+        try:
+            # Без активного клиента _check_and_process_trades сразу вернет 0
+            active_count = self._check_and_process_trades(account_name)
+            delay = self._next_poll_interval(state, active_count)
+            state.error_backoff = 0.0
+        
+        except Exception as e:
+            self.logger.error("Ошибка в мониторинге трейдов для {}: {}", account_name, e)
+            delay = self._next_error_backoff(state)
+        
+        finally:
+            with self._tasks_cond:
+                state.in_flight = False
+                # Аккаунт могли снять с мониторинга (или перезапустить), пока шла проверка
+                if self.running_tasks.get(account_name) is state:
+                    if state.kick_pending:
+                        state.kick_pending = False
+                        delay = 0
+                    self._schedule_check(account_name, state, time.monotonic() + delay)
+                    self._tasks_cond.notify()
+    
+    def _next_poll_interval(self, state: _AccountState, active_count: int) -> float:
+        """
+        Адаптивный интервал: удваивается, пока активных трейдов нет,
+        и уменьшается вдвое, когда они появляются
+        
+        Args:
+            state: Состояние мониторинга аккаунта
+            active_count: Сколько активных входящих трейдов было при проверке
             
-            while self.is_running and account_name in self.running_tasks:
-                try:
-                    if account_name in self.clients:
-                        self._check_and_process_trades(account_name)
-                    
-                    time.sleep(config.seconds_to_check_trades)
-                    
-                except Exception as e:
-                    self.logger.error(f"Ошибка в мониторинге трейдов для {account_name}: {e}")
-                    time.sleep(30)  # Пауза при ошибке
+        Returns:
+            Пауза до следующей проверки в секундах
+        """
+        min_interval = state.config.seconds_to_check_trades
+        interval = state.current_interval
+        
+        if active_count == 0:
+            interval = min(interval * 2, min_interval * MAX_POLL_INTERVAL_FACTOR)
+        else:
+            interval = max(interval / 2, min_interval)
+        
+        state.current_interval = interval
+        return interval
+    
+    @staticmethod
+    def _next_error_backoff(state: _AccountState) -> float:
+        """
+        Экспоненциальная пауза после ошибки со случайным разбросом
+        
+        Args:
+            state: Состояние мониторинга аккаунта
+            
+        Returns:
+            Пауза до следующей проверки в секундах
+        """
+        if state.error_backoff:
+            state.error_backoff = min(state.error_backoff * 2, ERROR_BACKOFF_MAX)
+        else:
+            state.error_backoff = ERROR_BACKOFF_INITIAL
+        
+        return state.error_backoff * random.uniform(1 - ERROR_BACKOFF_JITTER, 1 + ERROR_BACKOFF_JITTER)
+    
+    def trigger_check(self, account_name: str) -> bool:
+        """
+        Внеочередная проверка трейдов аккаунта, не дожидаясь интервала опроса
         
-        task_thread = threading.Thread(target=trade_monitor, name=f"trade_monitor_{account_name}")
-        task_thread.daemon = True
-        self.running_tasks[account_name] = task_thread
-        task_thread.start()
+        Args:
+            account_name: Имя аккаунта
+            
+        Returns:
+            True если аккаунт находится на мониторинге трейдов
+        """
+        with self._tasks_cond:
+            state = self.running_tasks.get(account_name)
+            if state is None:
+                return False
+            
+            # Внешний сигнал о трейде: адаптивный интервал начинается заново
+            state.current_interval = state.config.seconds_to_check_trades
+            
+            if state.in_flight:
+                # Проверка уже идет - следующая начнется сразу после нее
+                state.kick_pending = True
+            else:
+                self._schedule_check(account_name, state, time.monotonic())
+                self._tasks_cond.notify()
+            
+            return True
     
     def _stop_account_tasks(self, account_name: str) -> None:
         """
@@ -231,52 +483,72 @@ class AccountManager:
         Args:
             account_name: Имя аккаунта
         """
-        if account_name in self.running_tasks:
-            # Поток завершится сам при следующей проверке is_running
-            del self.running_tasks[account_name]
+        with self._tasks_cond:
+            # Планировщик больше не выберет этот аккаунт
+            if self.running_tasks.pop(account_name, None) is not None:
+                # Сроки аккаунта убираются из кучи, чтобы остановки и перезапуски не копили устаревшие записи
+                self._poll_heap = [entry for entry in self._poll_heap if entry[1] != account_name]
+                heapq.heapify(self._poll_heap)
+            self._tasks_cond.notify()
     
-    def _check_and_process_trades(self, account_name: str) -> None:
+    def _check_and_process_trades(self, account_name: str) -> int:
         """
         Проверка и обработка трейдов для аккаунта
         
         Args:
             account_name: Имя аккаунта
+            
+        Returns:
+            Количество активных входящих трейдов
         """
-        if account_name not in self.clients:
-            return
+        client = self.clients.get(account_name)
+        if client is None:
+            return 0
         
-        client = self.clients[account_name]
-        config = self.config_manager.get_account(account_name)
+        config = self._get_config(account_name)
         
-        try:
-            # Получаем активные трейд-офферы
-            trades_response = client.get_trade_offers()
-            received_offers = trades_response.get('response', {}).get('trade_offers_received', [])
+        # Ошибка запроса поднимается в _run_trade_check, который откладывает следующую попытку
+        trades_response = client.get_trade_offers()
+        received_offers = trades_response.get('response', {}).get('trade_offers_received', [])
+        
+        return self._process_received_offers(account_name, client, config, received_offers)
+    
+    def _process_received_offers(self, account_name: str, client: SteamClient, config: AccountConfig,
+                                 received_offers: List[Dict[str, Any]]) -> int:
+        """
+        Обработка полученных входящих трейд-офферов
+        
+        Args:
+            account_name: Имя аккаунта
+            client: Steam клиент аккаунта
+            config: Конфигурация аккаунта
+            received_offers: Входящие офферы из ответа GetTradeOffers
             
-            for offer in received_offers:
-                if offer.get('trade_offer_state') != TradeOfferState.Active:
-                    continue
-                
-                trade_id = offer.get('tradeofferid')
-                if not trade_id:
-                    continue
-                
-                # Проверяем условия принятия трейда
-                should_accept = self._should_accept_trade(offer, config)
+        Returns:
+            Количество активных входящих трейдов
+        """
+        active_offers = [offer for offer in received_offers if offer.get('trade_offer_state') == _ACTIVE]
+        
+        for offer in active_offers:
+            trade_id = offer.get('tradeofferid')
+            if not trade_id:
+                continue
+            
+            # Проверяем условия принятия трейда
+            should_accept = self._should_accept_trade(offer, config)
+            
+            if should_accept:
+                try:
+                    result = client.accept_trade_offer(trade_id)
+                    if result:
+                        self.logger.info("Принят трейд {} для {}", trade_id, account_name)
+                    else:
+                        self.logger.warning("Не удалось принять трейд {} для {}", trade_id, account_name)
                 
-                if should_accept:
-                    try:
-                        result = client.accept_trade_offer(trade_id)
-                        if result:
-                            self.logger.info(f"Принят трейд {trade_id} для {account_name}")
-                        else:
-                            self.logger.warning(f"Не удалось принять трейд {trade_id} для {account_name}")
-                    
-                    except Exception as e:
-                        self.logger.error(f"Ошибка принятия трейда {trade_id} для {account_name}: {e}")
+                except Exception as e:
+                    self.logger.error("Ошибка принятия трейда {} для {}: {}", trade_id, account_name, e)
         
-        except Exception as e:
-            self.logger.error(f"Ошибка получения трейдов для {account_name}: {e}")
+        return len(active_offers)
     
     def _should_accept_trade(self, offer: Dict[str, Any], config: AccountConfig) -> bool:
         """
@@ -289,18 +561,9 @@ class AccountManager:
         Returns:
             True если трейд следует принять
         """
-        # Если трейд уже принят в веб-интерфейсе
-        if config.accept_every_accepted_on_web_trade:
-            # Дополнительная логика для проверки статуса в веб-интерфейсе
-            pass
-        
-        # Если это "бесплатный" трейд (мы ничего не отдаем)
-        if config.accept_every_free_trade:
-            items_to_give = offer.get('items_to_give', [])
-            if not items_to_give:  # Мы ничего не отдаем
-                return True
-        
-        return False
+        # Принимаем только "бесплатные" трейды (мы ничего не отдаем).
+        # accept_every_accepted_on_web_trade здесь пока не обрабатывается
+        return bool(config.accept_every_free_trade and not offer.get('items_to_give'))
     
     def get_account_status(self, account_name: str) -> Dict[str, Any]:
         """
@@ -323,12 +586,17 @@ class AccountManager:
         
         try:
             # Получаем конфигурацию
-            config = self.config_manager.get_account(account_name)
-            status['config'] = config.to_dict()
+            config_dict = self._config_dict_cache.get(account_name)
+            if config_dict is None:
+                config_dict = self._get_config(account_name).to_dict()
+                self._config_dict_cache[account_name] = config_dict
+            # Копия, чтобы вызывающий код не изменил закэшированный словарь
+            status['config'] = dict(config_dict)
             
             # Проверяем session manager
-            if account_name in self.session_managers:
-                session_status = self.session_managers[account_name].get_status()
+            session_manager = self.session_managers.get(account_name)
+            if session_manager is not None:
+                session_status = session_manager.get_status()
                 status.update(session_status)
             
             # Проверяем мониторинг трейдов
@@ -347,20 +615,30 @@ class AccountManager:
         Returns:
             Словарь со статусами всех аккаунтов
         """
-        statuses = {}
-        
-        for account_name in self.config_manager.list_accounts():
-            statuses[account_name] = self.get_account_status(account_name)
-        
-        return statuses
+        # get_status может проверять сессию по сети, поэтому опрашиваем аккаунты параллельно
+        executor = self._get_fanout_pool()
+        futures = [
+            (account_name, executor.submit(self.get_account_status, account_name))
+            for account_name in self.config_manager.list_accounts()
+        ]
+        
+        return {account_name: future.result() for account_name, future in futures}
     
     def start_all_monitoring(self) -> None:
         """Запуск мониторинга для всех аккаунтов"""
         self.is_running = True
         
-        for account_name in self.config_manager.list_accounts():
+        # Вход во все аккаунты параллельно: каждый логин - несколько блокирующих HTTPS запросов
+        executor = self._get_fanout_pool()
+        future_to_account = {
+            executor.submit(self.login_account, account_name): account_name
+            for account_name in self.config_manager.list_accounts()
+        }
+        
+        for future in concurrent.futures.as_completed(future_to_account):
+            account_name = future_to_account[future]
             try:
-                if self.login_account(account_name):
+                if future.result():
                     self.start_account_monitoring(account_name)
                 else:
                     self.logger.error(f"Не удалось войти в аккаунт {account_name}")
@@ -375,8 +653,25 @@ class AccountManager:
         for account_name in list(self.session_managers.keys()):
             self.stop_account_monitoring(account_name)
         
-        # Очищаем задачи
-        self.running_tasks.clear()
+        # Очищаем задачи и будим планировщик, чтобы он сразу увидел is_running = False
+        with self._tasks_cond:
+            self.running_tasks.clear()
+            self._poll_heap.clear()
+            io_pool, self._io_pool = self._io_pool, None
+            scheduler_thread, self._scheduler_thread = self._scheduler_thread, None
+            self._tasks_cond.notify_all()
+        
+        if scheduler_thread is not None and scheduler_thread is not threading.current_thread():
+            scheduler_thread.join(timeout=2.0)
+        
+        if io_pool is not None:
+            io_pool.shutdown(wait=False)
+        
+        with self._fanout_lock:
+            fanout_pool, self._fanout_pool = self._fanout_pool, None
+        
+        if fanout_pool is not None:
+            fanout_pool.shutdown(wait=False)
     
     def perform_action_on_account(self, account_name: str, action: Callable, *args, **kwargs) -> Any:
         """
@@ -391,23 +686,31 @@ class AccountManager:
         Returns:
             Результат выполнения действия
         """
-        if account_name not in self.clients:
-            raise ValueError(f"Клиент для аккаунта {account_name} не активен")
-        
-        client = self.clients[account_name]
+        try:
+            client = self.clients[account_name]
+        except KeyError:
+            raise ValueError(f"Клиент для аккаунта {account_name} не активен") from None
         
+        return self._run_action(account_name, client, action, *args, **kwargs)
+    
+    def _run_action(self, account_name: str, client: SteamClient, action: Callable, *args, **kwargs) -> Any:
+        """Вызов действия для уже известного клиента с логированием ошибки"""
         try:
             return action(client, *args, **kwargs)
         except Exception as e:
-            self.logger.error(f"Ошибка выполнения действия для {account_name}: {e}")
+            self.logger.error("Ошибка выполнения действия для {}: {}", account_name, e)
             raise
     
     def perform_action_on_all(self, action: Callable, *args, **kwargs) -> Dict[str, Any]:
         """
         Выполнение действия на всех активных аккаунтах параллельно
         
+        Запросы выполняются в общем пуле потоков, поэтому суммарное время близко к самому
+        медленному аккаунту, а не к сумме RTT. Например, балансы всех кошельков:
+        ``manager.perform_action_on_all(SteamClient.get_wallet_balance)``
+        
         Args:
-            action: Функция для выполнения
+            action: Функция для выполнения, первым аргументом получает SteamClient
             *args: Позиционные аргументы
             **kwargs: Именованные аргументы
             
@@ -416,20 +719,25 @@ class AccountManager:
         """
         results = {}
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(self.clients)) as executor:
-            # Запускаем задачи
-            future_to_account = {
-                executor.submit(self.perform_action_on_account, account_name, action, *args, **kwargs): account_name
-                for account_name in self.clients.keys()
-            }
-            
-            # Собираем результаты
-            for future in concurrent.futures.as_completed(future_to_account):
-                account_name = future_to_account[future]
-                try:
-                    result = future.result()
-                    results[account_name] = {'success': True, 'result': result}
-                except Exception as e:
-                    results[account_name] = {'success': False, 'error': str(e)}
+        # Снимок читается без блокировки: кортеж заменяется целиком
+        clients_snapshot = self._clients_snapshot
+        if not clients_snapshot:
+            return results
+        
+        executor = self._get_fanout_pool()
+        
+        # Запускаем задачи; результаты собираются в порядке снимка, без словаря future -> аккаунт
+        pending = [
+            (account_name, executor.submit(self._run_action, account_name, client, action, *args, **kwargs))
+            for account_name, client in clients_snapshot
+        ]
+        
+        # Собираем результаты
+        for account_name, future in pending:
+            try:
+                result = future.result()
+                results[account_name] = {'success': True, 'result': result}
+            except Exception as e:
+                results[account_name] = {'success': False, 'error': str(e)}
         
         return results 
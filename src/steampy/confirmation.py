@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import enum
 import json
+import os
 import time
 from http import HTTPStatus
 from typing import TYPE_CHECKING
@@ -11,11 +12,18 @@ from bs4 import BeautifulSoup
 from . import guard
 from .exceptions import ConfirmationExpected
 from .login import InvalidCredentials
+from .utils import response_json
 from src.utils.logger_setup import logger
 
 if TYPE_CHECKING:
     import requests
 
+# Маркер ищется в сырых байтах ответа, без декодирования страницы
+_INVALID_GUARD_MARKER = b'Steam Guard Mobile Authenticator is providing incorrect Steam Guard codes.'
+
+# PYSDA_DEBUG_CONFIRMATIONS=1 - сохранять страницу getlist в debug_confirmations_page.txt
+DEBUG_CONFIRMATIONS_PAGE = os.environ.get('PYSDA_DEBUG_CONFIRMATIONS') == '1'
+
 
 class Confirmation:
     def __init__(self, data_confid, nonce, creator_id) -> None:
@@ -56,7 +64,7 @@ class ConfirmationExecutor:
         params['cid'] = confirmation.data_confid
         params['ck'] = confirmation.nonce
         headers = {'X-Requested-With': 'XMLHttpRequest'}
-        response = self._session.get(f'{self.CONF_URL}/ajaxop', params=params, headers=headers).json()
+        response = response_json(self._session.get(f'{self.CONF_URL}/ajaxop', params=params, headers=headers))
         logger.info(f"🔑 Отправлен запрос на подтверждение, response:\n {response}")
         
         return response
@@ -65,7 +73,7 @@ class ConfirmationExecutor:
         confirmations = []
         confirmations_page = self._fetch_confirmations_page()
         if confirmations_page.status_code == HTTPStatus.OK:
-            confirmations_json = json.loads(confirmations_page.text)
+            confirmations_json = response_json(confirmations_page)
             for conf in confirmations_json['conf']:
                 data_confid = conf['id']
                 nonce = conf['nonce']
@@ -89,8 +97,7 @@ class ConfirmationExecutor:
         key = int(key)
 
         confs: list[Confirmation] = self._get_confirmations()
-        # not well performant but anyway
-        conf = next(filter(lambda c: c.creator_id == key, confs), None)
+        conf = next((c for c in confs if c.creator_id == key), None)
         if conf is None:
             raise KeyError(f"Unable to find confirmation for {key} ident/trade/listing id")
 
@@ -109,21 +116,22 @@ class ConfirmationExecutor:
         params = self._create_confirmation_params(tag)
         headers = {'X-Requested-With': 'com.valvesoftware.android.steam.community'}
         response = self._session.get(f'{self.CONF_URL}/getlist', params=params, headers=headers)
-        if 'Steam Guard Mobile Authenticator is providing incorrect Steam Guard codes.' in response.text:
+        if _INVALID_GUARD_MARKER in response.content:
             raise InvalidCredentials('Invalid Steam Guard file')
-        # Сохраняем ответ в текстовый файл для отладки
-        try:
-            with open("debug_confirmations_page.txt", "w", encoding="utf-8") as f:
-                f.write(response.text)
-        except Exception as e:
-            pass  # Не мешаем основной логике, если не удалось сохранить
+        # Сохраняем ответ в текстовый файл для отладки (только если включено, иначе это запись на каждый запрос)
+        if DEBUG_CONFIRMATIONS_PAGE:
+            try:
+                with open("debug_confirmations_page.txt", "w", encoding="utf-8") as f:
+                    f.write(response.text)
+            except Exception as e:
+                pass  # Не мешаем основной логике, если не удалось сохранить
         return response
 
     def _fetch_confirmation_details_page(self, confirmation: Confirmation) -> str:
         tag = f'details{confirmation.data_confid}'
         params = self._create_confirmation_params(tag)
         response = self._session.get(f'{self.CONF_URL}/details/{confirmation.data_confid}', params=params)
-        return response.json()['html']
+        return response_json(response)['html']
 
     def _create_confirmation_params(self, tag_string: str) -> dict:
         timestamp = int(time.time())
@@ -4,6 +4,7 @@ import hmac
 import json
 import struct
 from base64 import b64decode, b64encode
+from functools import lru_cache
 from hashlib import sha1
 from pathlib import Path
 from time import time
@@ -25,11 +26,17 @@ def load_steam_guard(steam_guard: str) -> dict[str, str]:
         return json.loads(steam_guard, parse_int=str)
 
 
+@lru_cache(maxsize=64)
+def _decode_secret(secret: str) -> bytes:
+    # shared_secret/identity_secret аккаунта не меняются: base64 декодируется один раз на секрет
+    return b64decode(secret)
+
+
 def generate_one_time_code(shared_secret: str, timestamp: int | None = None) -> str:
     if timestamp is None:
         timestamp = int(time())
     time_buffer = struct.pack('>Q', timestamp // 30)  # pack as Big endian, uint64
-    time_hmac = hmac.new(b64decode(shared_secret), time_buffer, digestmod=sha1).digest()
+    time_hmac = hmac.new(_decode_secret(shared_secret), time_buffer, digestmod=sha1).digest()
     begin = ord(time_hmac[19:20]) & 0xF
     full_code = struct.unpack('>I', time_hmac[begin:begin + 4])[0] & 0x7FFFFFFF  # unpack as Big endian uint32
     chars = '23456789BCDFGHJKMNPQRTVWXY'
@@ -44,7 +51,7 @@ def generate_one_time_code(shared_secret: str, timestamp: int | None = None) ->
 
 def generate_confirmation_key(identity_secret: str, tag: str, timestamp: int = int(time())) -> bytes:
     buffer = struct.pack('>Q', timestamp) + tag.encode('ascii')
-    return b64encode(hmac.new(b64decode(identity_secret), buffer, digestmod=sha1).digest())
+    return b64encode(hmac.new(_decode_secret(identity_secret), buffer, digestmod=sha1).digest())
 
 
 # It works, however it's different that one generated from mobile app
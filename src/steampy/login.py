@@ -14,6 +14,7 @@ from rsa import PublicKey, encrypt
 from . import guard
 from .exceptions import ApiException, CaptchaRequired, InvalidCredentials
 from .models import SteamUrl, TransferResult
+from .utils import response_json
 
 from src.utils.logger_setup import logger
 
@@ -44,7 +45,7 @@ class LoginExecutor:
     def login(self) -> tuple[Session, str]:
         try:
             login_response = self._send_login_request()
-            if not login_response.json()['response']:
+            if not response_json(login_response)['response']:
                 raise ApiException('No response received from Steam API. Please try again later.')
             
             self._check_for_captcha(login_response)
@@ -73,8 +74,9 @@ class LoginExecutor:
         request_data = {'account_name': self.username}
         response = self._api_call('GET', 'IAuthenticationService', 'GetPasswordRSAPublicKey', params=request_data)
 
-        if response.status_code == HTTPStatus.OK and 'response' in response.json():
-            key_data = response.json()['response']
+        response_data = response_json(response) if response.status_code == HTTPStatus.OK else {}
+        if 'response' in response_data:
+            key_data = response_data['response']
             # Steam may return an empty 'response' value even if the status is 200
             if 'publickey_mod' in key_data and 'publickey_exp' in key_data and 'timestamp' in key_data:
                 rsa_mod = int(key_data['publickey_mod'], 16)
@@ -100,25 +102,28 @@ class LoginExecutor:
 
     @staticmethod
     def _check_for_captcha(login_response: Response) -> None:
-        if login_response.json().get('captcha_needed', False):
+        if response_json(login_response).get('captcha_needed', False):
             raise CaptchaRequired('Captcha required')
 
     def _enter_steam_guard_if_necessary(self, login_response: Response) -> Response:
-        if login_response.json()['requires_twofactor']:
+        if response_json(login_response)['requires_twofactor']:
             self.one_time_code = guard.generate_one_time_code(self.shared_secret)
             return self._send_login_request()
         return login_response
 
     @staticmethod
     def _assert_valid_credentials(login_response: Response) -> None:
-        if not login_response.json()['success']:
-            raise InvalidCredentials(login_response.json()['message'])
+        login_data = response_json(login_response)
+        if not login_data['success']:
+            raise InvalidCredentials(login_data['message'])
 
     def _update_steam_guard(self, login_response: Response) -> None:
         try:
-            client_id = login_response.json()['response']['client_id']
-            steamid = login_response.json()['response']['steamid']
-            request_id = login_response.json()['response']['request_id']
+            # Ответ разбирается один раз, а не на каждое поле
+            auth_session = response_json(login_response)['response']
+            client_id = auth_session['client_id']
+            steamid = auth_session['steamid']
+            request_id = auth_session['request_id']
             code_type = 3
             code = guard.generate_one_time_code(self.shared_secret)
 
@@ -138,7 +143,7 @@ class LoginExecutor:
         try:
             pool_data = {'client_id': client_id, 'request_id': request_id}
             response = self._api_call('POST', 'IAuthenticationService', 'PollAuthSessionStatus', params=pool_data)
-            self.refresh_token = response.json()['response']['refresh_token']
+            self.refresh_token = response_json(response)['response']['refresh_token']
         except Exception as e:
             print(f"❌ Ошибка в _pool_sessions_steam: {e}")
             raise
@@ -261,7 +266,7 @@ class LoginExecutor:
             raise Exception(f'HTTP error {finalize_response.status_code}')
 
         try:
-            json_body = finalize_response.json()
+            json_body = response_json(finalize_response)
         except:
             raise Exception('Invalid JSON response from finalizelogin')
 
@@ -428,7 +433,7 @@ class LoginExecutor:
                 if result.status_code >= 400:
                     raise Exception(f'HTTP error {result.status_code}')
 
-                json_result = result.json()
+                json_result = response_json(result)
                 logger.info(f"🔍 JSON result: {json_result}")
                 if json_result.get('result') and json_result['result'] != TransferResult.OK:
                     raise Exception(f'Steam error result: {json_result["result"]}')
@@ -14,6 +14,7 @@ from .utils import (
     get_market_sell_listings_from_api,
     login_required,
     merge_items_with_descriptions_from_listing,
+    response_json,
     text_between,
 )
 
@@ -50,7 +51,7 @@ class SteamMarket:
         if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
             raise TooManyRequests('You can fetch maximum 20 prices in 60s period')
 
-        return response.json()
+        return response_json(response)
 
     @login_required
     def fetch_price_history(self, item_hash_name: str, game: GameOptions) -> dict:
@@ -61,7 +62,7 @@ class SteamMarket:
         if response.status_code == HTTPStatus.TOO_MANY_REQUESTS:
             raise TooManyRequests('You can fetch maximum 20 prices in 60s period')
 
-        return response.json()
+        return response_json(response)
 
     @login_required
     def get_my_market_listings(self) -> dict:
@@ -69,17 +70,19 @@ class SteamMarket:
         if response.status_code != HTTPStatus.OK:
             raise ApiException(f'There was a problem getting the listings. HTTP code: {response.status_code}')
 
-        assets_descriptions = json.loads(text_between(response.text, 'var g_rgAssets = ', ';\n'))
-        listing_id_to_assets_address = get_listing_id_to_assets_address_from_html(response.text)
-        listings = get_market_listings_from_html(response.text)
+        # response.text не кэшируется requests и декодирует тело заново при каждом обращении
+        html = response.text
+        assets_descriptions = json.loads(text_between(html, 'var g_rgAssets = ', ';\n'))
+        listing_id_to_assets_address = get_listing_id_to_assets_address_from_html(html)
+        listings = get_market_listings_from_html(html)
         listings = merge_items_with_descriptions_from_listing(
             listings, listing_id_to_assets_address, assets_descriptions,
         )
 
-        if '<span id="tabContentsMyActiveMarketListings_end">' in response.text:
-            n_showing = int(text_between(response.text, '<span id="tabContentsMyActiveMarketListings_end">', '</span>'))
+        if '<span id="tabContentsMyActiveMarketListings_end">' in html:
+            n_showing = int(text_between(html, '<span id="tabContentsMyActiveMarketListings_end">', '</span>'))
             n_total = int(
-                text_between(response.text, '<span id="tabContentsMyActiveMarketListings_total">', '</span>').replace(
+                text_between(html, '<span id="tabContentsMyActiveMarketListings_total">', '</span>').replace(
                     ',', '',
                 ),
             )
@@ -90,7 +93,7 @@ class SteamMarket:
                 if response.status_code != HTTPStatus.OK:
                     raise ApiException(f'There was a problem getting the listings. HTTP code: {response.status_code}')
 
-                jresp = response.json()
+                jresp = response_json(response)
                 listing_id_to_assets_address = get_listing_id_to_assets_address_from_html(jresp.get('hovers'))
                 listings_2 = get_market_sell_listings_from_api(jresp.get('results_html'))
                 listings_2 = merge_items_with_descriptions_from_listing(
@@ -105,7 +108,7 @@ class SteamMarket:
                         raise ApiException(
                             f'There was a problem getting the listings. HTTP code: {response.status_code}',
                         )
-                    jresp = response.json()
+                    jresp = response_json(response)
                     listing_id_to_assets_address = get_listing_id_to_assets_address_from_html(jresp.get('hovers'))
                     listings_2 = get_market_sell_listings_from_api(jresp.get('results_html'))
                     listings_2 = merge_items_with_descriptions_from_listing(
@@ -127,7 +130,7 @@ class SteamMarket:
         }
         headers = {'Referer': f'{SteamUrl.COMMUNITY_URL}/profiles/{self._steam_guard["steamid"]}/inventory'}
 
-        response = self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/sellitem/', data, headers=headers).json()
+        response = response_json(self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/sellitem/', data, headers=headers))
         has_pending_confirmation = 'pending confirmation' in response.get('message', '')
         if response.get('needs_mobile_confirmation') or (not response.get('success') and has_pending_confirmation):
             return self._confirm_sell_listing(assetid)
@@ -155,7 +158,7 @@ class SteamMarket:
             'Referer': f'{SteamUrl.COMMUNITY_URL}/market/listings/{game.app_id}/{urllib.parse.quote(market_name)}',
         }
 
-        response = self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/createbuyorder/', data, headers=headers).json()
+        response = response_json(self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/createbuyorder/', data, headers=headers))
 
         if (success := response.get('success')) != 1:
             raise ApiException(
@@ -185,9 +188,9 @@ class SteamMarket:
         headers = {
             'Referer': f'{SteamUrl.COMMUNITY_URL}/market/listings/{game.app_id}/{urllib.parse.quote(market_name)}',
         }
-        response = self._session.post(
+        response = response_json(self._session.post(
             f'{SteamUrl.COMMUNITY_URL}/market/buylisting/{market_id}', data, headers=headers,
-        ).json()
+        ))
 
         try:
             if (success := response['wallet_info']['success']) != 1:
@@ -213,7 +216,7 @@ class SteamMarket:
     def cancel_buy_order(self, buy_order_id) -> dict:
         data = {'sessionid': self._session_id, 'buy_orderid': buy_order_id}
         headers = {'Referer': f'{SteamUrl.COMMUNITY_URL}/market'}
-        response = self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/cancelbuyorder/', data, headers=headers).json()
+        response = response_json(self._session.post(f'{SteamUrl.COMMUNITY_URL}/market/cancelbuyorder/', data, headers=headers))
 
         if (success := response.get('success')) != 1:
             raise ApiException(f'There was a problem canceling the order. success: {success}')
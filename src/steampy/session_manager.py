@@ -14,7 +14,7 @@ import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, Optional, Any
 import signal
 import getpass
 import traceback
@@ -23,9 +23,13 @@ import requests
 from cryptography.fernet import Fernet
 import keyring
 
-from .client import SteamClient
 from .guard import generate_one_time_code, load_steam_guard
 from .models import SteamUrl
+from .utils import page_contains_username
+
+if TYPE_CHECKING:
+    # Клиент тянет за собой весь CLI и pydantic модели - импортируем его только при входе
+    from .client import SteamClient
 
 # logger уже импортирован из logger_setup
 
@@ -43,7 +47,7 @@ class SecureSessionManager:
         self.username = username
         self.check_interval = check_interval
         self.running = False
-        self.client: Optional[SteamClient] = None
+        self.client: Optional['SteamClient'] = None
         self.monitor_thread: Optional[threading.Thread] = None
         self.last_check = datetime.now()
         
@@ -181,7 +185,7 @@ class SecureSessionManager:
             
             is_valid = (
                 response.status_code == 200 and 
-                self.username.lower() in response.text.lower()
+                page_contains_username(response.content, self.username)
             )
             
             if is_valid:
@@ -197,6 +201,8 @@ class SecureSessionManager:
     
     def login(self, force_refresh: bool = False) -> bool:
         """Вход в Steam с созданием новой сессии"""
+        from .client import SteamClient
+
         try:
             password, api_key, guard_path = self._get_credentials()
             
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import copy
+import json
 import math
 import re
 import struct
 from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse
@@ -16,10 +18,48 @@ from requests.structures import CaseInsensitiveDict
 
 from .exceptions import LoginRequired, ProxyConnectionError
 
+try:
+    import orjson
+except ImportError:  # необязательная зависимость, см. [project.optional-dependencies] speedups
+    orjson = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:  # необязательная зависимость, см. [project.optional-dependencies] speedups
+    HTML_PARSER = 'html.parser'
+
 if TYPE_CHECKING:
     from .models import GameOptions
 
 
+def json_loads(data: bytes | str):
+    """Разбор JSON через orjson (если установлен), иначе через stdlib json"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def response_json(response: requests.Response):
+    """Замена response.json() для ответов Steam (всегда UTF-8): разбирает сырые байты тела"""
+    return json_loads(response.content)
+
+
+@lru_cache(maxsize=256)
+def _username_pattern(username: str, as_bytes: bool) -> re.Pattern:
+    if as_bytes:
+        return re.compile(re.escape(username.encode()), re.IGNORECASE)
+    return re.compile(re.escape(username), re.IGNORECASE)
+
+
+def page_contains_username(page: str | bytes, username: str) -> bool:
+    """
+    Регистронезависимый поиск логина на странице без копирования страницы через lower().
+    Можно передать сырое тело ответа (bytes), тогда страница не декодируется.
+    """
+    return _username_pattern(username, isinstance(page, bytes)).search(page) is not None
+
+
 def login_required(func):
     def func_wrapper(self, *args, **kwargs):
         if not self.was_login_executed:
@@ -126,8 +166,29 @@ def merge_items_with_descriptions_from_inventory(inventory_response: dict, game:
     return merge_items(inventory, descriptions, context_id=game.context_id)
 
 
+class DescriptionIndex(dict):
+    """
+    Словарь описаний по get_description_key, который заполняется по мере обращений:
+    при промахе список описаний просматривается дальше с места последней остановки.
+    Суммарно каждое описание индексируется не более одного раза.
+    Дозаполнение срабатывает только при доступе через [] (dict.get/in его не вызывают).
+    """
+
+    def __init__(self, descriptions: list[dict]):
+        super().__init__()
+        self._pending = iter(descriptions)
+
+    def __missing__(self, key: str) -> dict:
+        for description in self._pending:
+            description_key = get_description_key(description)
+            self[description_key] = description
+            if description_key == key:
+                return description
+        raise KeyError(key)
+
+
 def merge_items_with_descriptions_from_offers(offers_response: dict) -> dict:
-    descriptions = {get_description_key(offer): offer for offer in offers_response['response'].get('descriptions', [])}
+    descriptions = DescriptionIndex(offers_response['response'].get('descriptions', []))
     received_offers = offers_response['response'].get('trade_offers_received', [])
     sent_offers = offers_response['response'].get('trade_offers_sent', [])
     offers_response['response']['trade_offers_received'] = [merge_items_with_descriptions_from_offer(offer, descriptions) for offer in received_offers]
@@ -243,9 +304,14 @@ def get_description_key(item: dict) -> str:
     return f'{item["classid"]}_{item["instanceid"]}'
 
 
+def parse_query(query: str, case_sensitive: bool = True) -> dict:
+    """Разбирает query-строку один раз, чтобы несколько параметров читались без повторного разбора"""
+    params = parse_qs(query)
+    return params if case_sensitive else CaseInsensitiveDict(params)
+
+
 def get_key_value_from_url(url: str, key: str, case_sensitive: bool = True) -> str:
-    params = urlparse(url).query
-    return parse_qs(params)[key][0] if case_sensitive else CaseInsensitiveDict(parse_qs(params))[key][0]
+    return parse_query(urlparse(url).query, case_sensitive)[key][0]
 
 
 def load_credentials():
@@ -263,8 +329,9 @@ class Credentials:
 
 def ping_proxy(proxies: dict) -> bool:
     try:
-        requests.get('https://steamcommunity.com/', proxies=proxies)
-        return True
+        # Достаточно получить заголовки ответа: тело страницы не загружаем
+        with requests.get('https://steamcommunity.com/', proxies=proxies, stream=True):
+            return True
     except Exception:
         raise ProxyConnectionError('Proxy not working for steamcommunity.com')
 
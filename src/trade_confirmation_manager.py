@@ -16,9 +16,12 @@ from src.steampy.client import SteamClient
 from src.steampy.guard import generate_one_time_code, generate_confirmation_key, load_steam_guard
 from src.models import TradeOffersResponse, TradeOffer, TradeOfferState, SteamApiResponse
 from src.cookie_manager import CookieManager
-from src.steampy.confirmation import Confirmation, ConfirmationExecutor
+from src.steampy.confirmation import Confirmation
 from src.steampy.models import ConfirmationType
 
+# Рабочий регекс из оригинального кода: кандидаты в API ключ (32 символа без разметки и строчных букв)
+_API_KEY_CANDIDATE_RE = re.compile(r"([^\\\n.>\\\t</_=:, $(abcdefghijklmnopqrstuvwxyz )&;-]{32})")
+
 
 class TradeConfirmationManager:
     """Менеджер для работы с трейдами и подтверждениями"""
@@ -125,12 +128,9 @@ class TradeConfirmationManager:
             
             # Делаем запрос к API
             api_response = steam_client.api_call('GET', 'IEconService', 'GetTradeOffers', 'v1', params)
-            response_data = api_response.json()
-            
-
             
-            # Парсим ответ напрямую как TradeOffersResponse
-            trade_offers = TradeOffersResponse(**response_data.get('response', {}))
+            # Парсим байты ответа напрямую в TradeOffersResponse (без промежуточного dict)
+            trade_offers = TradeOffersResponse.from_bytes(api_response.content)
             
             logger.info(f"✅ Получено трейд офферов:")
             logger.info(f"  - Входящие всего: {len(trade_offers.trade_offers_received)}")
@@ -166,7 +166,7 @@ class TradeConfirmationManager:
                 return None
             
             # Используем рабочий регекс из оригинального кода
-            data_apikey = re.findall(r"([^\\\n.>\\\t</_=:, $(abcdefghijklmnopqrstuvwxyz )&;-]{32})", fr"{req.text}")
+            data_apikey = _API_KEY_CANDIDATE_RE.findall(req.text)
             
             logger.info(f"Найдено потенциальных ключей: {len(data_apikey)}")
             if data_apikey:
@@ -312,14 +312,7 @@ class TradeConfirmationManager:
                 logger.warning("⚠️ Steam Guard не настроен, невозможно получить подтверждения")
                 return []
             
-            # Создаем ConfirmationExecutor для работы с подтверждениями
-            from .steampy.confirmation import ConfirmationExecutor
-            
-            confirmation_executor = ConfirmationExecutor(
-                identity_secret=steam_client.steam_guard['identity_secret'],
-                my_steam_id=steam_client.steam_id,
-                session=steam_client._session
-            )
+            confirmation_executor = steam_client.confirmation_executor()
             
             # Получаем подтверждения через ConfirmationExecutor
             confirmations = confirmation_executor._get_confirmations()
@@ -363,15 +356,9 @@ class TradeConfirmationManager:
                 logger.warning("⚠️ Steam Guard не настроен, невозможно получить подтверждения")
                 return []
             
-            # Создаем ConfirmationExecutor для работы с подтверждениями
-            from .steampy.confirmation import ConfirmationExecutor
             from src.utils.confirmation_utils import determine_confirmation_type_from_json, extract_confirmation_info
             
-            confirmation_executor = ConfirmationExecutor(
-                identity_secret=steam_client.steam_guard['identity_secret'],
-                my_steam_id=steam_client.steam_id,
-                session=steam_client._session
-            )
+            confirmation_executor = steam_client.confirmation_executor()
             
             # Получаем JSON с подтверждениями напрямую
             confirmations_page = confirmation_executor._fetch_confirmations_page()
@@ -458,14 +445,7 @@ class TradeConfirmationManager:
             
             logger.info(f"🔑 Подтверждаем подтверждение Guard: {confirmation_obj.data_confid}")
             
-            # Создаем ConfirmationExecutor
-            from .steampy.confirmation import ConfirmationExecutor
-            
-            confirmation_executor = ConfirmationExecutor(
-                identity_secret=steam_client.steam_guard['identity_secret'],
-                my_steam_id=steam_client.steam_id,
-                session=steam_client._session
-            )
+            confirmation_executor = steam_client.confirmation_executor()
             
             # Подтверждаем через executor используя переданный объект
             response = confirmation_executor._send_confirmation(confirmation_obj)
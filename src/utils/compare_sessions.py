@@ -34,17 +34,11 @@ def compare_session_cookies(old_session: requests.Session, new_session: requests
     """
     result = {}
     
-    # Получаем все домены из обеих сессий
-    old_domains = set()
-    new_domains = set()
+    # Один проход по каждому jar: группируем cookies по доменам
+    old_by_domain = _cookies_by_domain(old_session)
+    new_by_domain = _cookies_by_domain(new_session)
     
-    for cookie in old_session.cookies:
-        old_domains.add(cookie.domain)
-    
-    for cookie in new_session.cookies:
-        new_domains.add(cookie.domain)
-    
-    all_domains = old_domains.union(new_domains)
+    all_domains = old_by_domain.keys() | new_by_domain.keys()
     
     # Анализируем каждый домен
     for domain in all_domains:
@@ -55,20 +49,11 @@ def compare_session_cookies(old_session: requests.Session, new_session: requests
             'unchanged': {}
         }
         
-        # Получаем cookies для конкретного домена
-        old_domain_cookies = {}
-        new_domain_cookies = {}
-        
-        for cookie in old_session.cookies:
-            if cookie.domain == domain:
-                old_domain_cookies[cookie.name] = cookie.value
-        
-        for cookie in new_session.cookies:
-            if cookie.domain == domain:
-                new_domain_cookies[cookie.name] = cookie.value
+        old_domain_cookies = old_by_domain.get(domain, {})
+        new_domain_cookies = new_by_domain.get(domain, {})
         
         # Находим все уникальные имена cookies
-        all_cookie_names = set(old_domain_cookies.keys()).union(set(new_domain_cookies.keys()))
+        all_cookie_names = old_domain_cookies.keys() | new_domain_cookies.keys()
         
         for cookie_name in all_cookie_names:
             old_value = old_domain_cookies.get(cookie_name)
@@ -101,6 +86,14 @@ def compare_session_cookies(old_session: requests.Session, new_session: requests
     return result
 
 
+def _cookies_by_domain(session: requests.Session) -> dict:
+    """Группирует cookies сессии по доменам: {domain: {name: value}}"""
+    by_domain = {}
+    for cookie in session.cookies:
+        by_domain.setdefault(cookie.domain, {})[cookie.name] = cookie.value
+    return by_domain
+
+
 def log_cookie_changes(changes: dict, username: str = None):
     """
     Логирует изменения cookies в удобном формате
@@ -1,6 +1,16 @@
-from typing import Dict, Any
+import json
+import os
+import pickle
+from http.cookiejar import Cookie
+from typing import Dict, Any, Optional, Tuple
 import requests
 
+from src.utils.logger_setup import logger
+
+# Файл сессии аккаунта: <username>.json; <username>.pkl - старый формат, переносится при первой загрузке
+SESSION_FILE_SUFFIX = '.json'
+LEGACY_SESSION_FILE_SUFFIX = '.pkl'
+
 
 def extract_cookies_for_domain(cookies_dict: Dict[str, Any], domain: str) -> Dict[str, str]:
     """
@@ -49,4 +59,67 @@ def session_to_dict(session: requests.Session) -> Dict[str, Any]:
     return {
         'cookies': cookies_dict,
         'headers': dict(session.headers)
-    }
\ No newline at end of file
+    }
+
+
+def dict_to_session(session_dict: Dict[str, Any], session: Optional[requests.Session] = None) -> requests.Session:
+    """
+    Обратное преобразование для session_to_dict: восстанавливает cookies (со всеми атрибутами) и заголовки.
+    """
+    if session is None:
+        session = requests.Session()
+    for paths in session_dict.get('cookies', {}).values():
+        for path_cookies in paths.values():
+            for attrs in path_cookies.values():
+                attrs = dict(attrs)
+                attrs['rest'] = attrs.pop('_rest')
+                session.cookies.set_cookie(Cookie(**attrs))
+    session.headers.update(session_dict.get('headers', {}))
+    return session
+
+
+def save_session_file(path: str, session: requests.Session, refresh_token: Optional[str]) -> None:
+    """
+    Сохраняет cookies, заголовки, прокси и refresh токен в JSON (без pickle объекта Session с адаптерами).
+    """
+    data = {
+        'refresh_token': refresh_token,
+        'session': session_to_dict(session),
+        'proxies': dict(session.proxies),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+
+def load_session_file(path: str) -> Tuple[requests.Session, Optional[str]]:
+    """
+    Загружает сессию и refresh токен, сохраненные save_session_file (путь с любым расширением
+    читается как <имя>.json). Если JSON еще нет, а рядом лежит файл старого формата <имя>.pkl,
+    он один раз переносится в JSON и удаляется.
+    """
+    json_path = os.path.splitext(path)[0] + SESSION_FILE_SUFFIX
+    try:
+        with open(json_path, 'rb') as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return _migrate_legacy_session_file(json_path)
+
+    session = dict_to_session(data['session'])
+    # Pickle сохранял Session целиком вместе с прокси - восстанавливаем их так же
+    session.proxies.update(data.get('proxies') or {})
+    return session, data.get('refresh_token')
+
+
+def _migrate_legacy_session_file(json_path: str) -> Tuple[requests.Session, Optional[str]]:
+    """
+    Перенос сессии из pickle кортежа (Session, refresh_token) в JSON.
+    Нет и старого файла - FileNotFoundError, как при отсутствии сессии.
+    """
+    legacy_path = os.path.splitext(json_path)[0] + LEGACY_SESSION_FILE_SUFFIX
+    with open(legacy_path, 'rb') as f:
+        session, refresh_token = pickle.load(f)
+
+    save_session_file(json_path, session, refresh_token)
+    os.remove(legacy_path)
+    logger.info(f"📦 Сессия {legacy_path} перенесена в {json_path}")
+    return session, refresh_token
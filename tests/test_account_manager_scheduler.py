@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Тест планировщика проверок трейдов AccountManager на фейковых клиентах
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from src.steampy import account_manager
+from src.steampy.account_manager import AccountManager, _AccountState
+
+INTERVAL = 10.0
+
+
+class ApiError(Exception):
+    pass
+
+
+def _config(interval: float = INTERVAL) -> SimpleNamespace:
+    return SimpleNamespace(seconds_to_check_trades=interval, allowed_to_check_and_accept_new_trades=True)
+
+
+@pytest.fixture
+def manager():
+    config_manager = mock.Mock()
+    config_manager.get_all_accounts.return_value = {}
+    manager = AccountManager(config_manager)
+    manager.is_running = True
+    yield manager
+    manager.stop_all_monitoring()
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, 'условие не выполнилось вовремя'
+        time.sleep(0.01)
+
+
+def _scheduler_threads() -> list:
+    return [t for t in threading.enumerate() if t.name.startswith(('trade_scheduler', 'trade_io'))]
+
+
+class _RecordingPool:
+    """Пул, который только запоминает порядок отправленных проверок"""
+
+    def __init__(self, expected: int):
+        self.submitted = []
+        self.done = threading.Event()
+        self._expected = expected
+
+    def submit(self, fn, account_name, state):
+        self.submitted.append(account_name)
+        if len(self.submitted) == self._expected:
+            self.done.set()
+
+    def shutdown(self, wait=True):
+        pass
+
+
+def test_scheduler_submits_due_accounts_in_deadline_order(manager):
+    pool = _RecordingPool(expected=3)
+    manager._io_pool = pool
+    now = time.monotonic()
+    with manager._tasks_cond:
+        for name, offset in (('late', -1.0), ('first', -3.0), ('future', 100.0), ('second', -2.0)):
+            state = _AccountState(config=_config(), current_interval=INTERVAL)
+            manager.running_tasks[name] = state
+            manager._schedule_check(name, state, now + offset)
+
+    thread = threading.Thread(target=manager._trade_scheduler, name='trade_scheduler', daemon=True)
+    manager._scheduler_thread = thread
+    thread.start()
+
+    assert pool.done.wait(2.0)
+    assert pool.submitted == ['first', 'second', 'late']
+    assert manager._poll_heap == [(now + 100.0, 'future')]
+
+
+def test_poll_interval_doubles_and_halves_within_bounds(manager):
+    state = _AccountState(config=_config(), current_interval=INTERVAL)
+    cap = INTERVAL * account_manager.MAX_POLL_INTERVAL_FACTOR
+
+    idle = [manager._next_poll_interval(state, 0) for _ in range(6)]
+    assert idle == [20.0, 40.0, 80.0, 160.0, cap, cap]
+
+    busy = [manager._next_poll_interval(state, 1) for _ in range(6)]
+    assert busy == [80.0, 40.0, 20.0, 10.0, INTERVAL, INTERVAL]
+
+
+def test_error_backoff_grows_and_resets_after_success(manager, monkeypatch):
+    monkeypatch.setattr(account_manager.random, 'uniform', lambda a, b: 1.0)
+    state = _AccountState(config=_config(), current_interval=INTERVAL)
+    manager.running_tasks['acc'] = state
+    check = mock.Mock(side_effect=ApiError)
+    monkeypatch.setattr(manager, '_check_and_process_trades', check)
+
+    delays = []
+    for _ in range(6):
+        manager._run_trade_check('acc', state)
+        delays.append(state.error_backoff)
+    assert delays == [30.0, 60.0, 120.0, 240.0, 300.0, 300.0]
+
+    check.side_effect = None
+    check.return_value = 1
+    manager._run_trade_check('acc', state)
+    assert state.error_backoff == 0.0
+    assert state.next_deadline - time.monotonic() <= INTERVAL
+
+
+def test_trigger_during_check_runs_exactly_one_follow_up(manager, monkeypatch):
+    manager._config_cache['acc'] = _config(interval=1000.0)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def check(account_name):
+        calls.append(account_name)
+        if len(calls) == 1:
+            started.set()
+            release.wait(2.0)
+        return 0
+
+    monkeypatch.setattr(manager, '_check_and_process_trades', check)
+    manager._start_trade_monitoring('acc')
+    assert started.wait(2.0)
+
+    assert manager.trigger_check('acc')
+    assert manager.trigger_check('acc')
+    release.set()
+
+    state = manager.running_tasks['acc']
+    _wait_for(lambda: len(calls) == 2 and not state.in_flight)
+    time.sleep(0.1)
+    assert len(calls) == 2
+    assert not state.kick_pending
+
+
+def test_stop_and_restart_leave_no_stale_entries_or_threads(manager, monkeypatch):
+    manager._config_cache['acc'] = _config(interval=1000.0)
+    calls = []
+    monkeypatch.setattr(manager, '_check_and_process_trades', lambda account_name: calls.append(account_name) or 0)
+
+    for expected_calls in (1, 2):
+        manager._start_trade_monitoring('acc')
+        state = manager.running_tasks['acc']
+        _wait_for(lambda: len(calls) == expected_calls and not state.in_flight)
+        assert manager._poll_heap == [(state.next_deadline, 'acc')]
+
+        manager._stop_account_tasks('acc')
+        assert manager._poll_heap == []
+        assert 'acc' not in manager.running_tasks
+
+    manager.stop_all_monitoring()
+    _wait_for(lambda: not _scheduler_threads())
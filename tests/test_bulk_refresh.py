@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Тест параллельного bulk_refresh на заглушке сессии
+"""
+
+import json
+from unittest import mock
+
+from src.steampy.client import SteamClient
+from src.steampy.models import GameOptions
+
+RESPONSES = {
+    'GetTradeOffersSummary': {'response': {'pending_received_count': 1}},
+    'GetTradeOffers': {'response': {'trade_offers_received': [
+        {'tradeofferid': '7', 'accountid_other': 123, 'trade_offer_state': 2},
+    ]}},
+    '/inventory/': {'success': 1, 'assets': [], 'descriptions': []},
+}
+
+
+def _stub_get(url, *args, **kwargs):
+    # GetTradeOffersSummary проверяется раньше GetTradeOffers: второе имя - префикс первого
+    body = next(body for marker, body in RESPONSES.items() if marker in url)
+    return mock.Mock(status_code=200, content=json.dumps(body).encode())
+
+
+def test_bulk_refresh_returns_all_results():
+    client = SteamClient.__new__(SteamClient)
+    client.was_login_executed = True
+    client.login_if_need_to = mock.Mock()
+    client._api_key = 'key'
+    client.steam_id = '76561198000000001'
+    client._trade_partner_cache = {}
+    client._session = mock.Mock()
+    client._session.get.side_effect = _stub_get
+
+    result = client.bulk_refresh(GameOptions.CS)
+
+    assert set(result) == {'summary', 'trade_offers', 'inventory'}
+    assert result['summary'] == RESPONSES['GetTradeOffersSummary']
+    assert [offer['tradeofferid'] for offer in result['trade_offers']['response']['trade_offers_received']] == ['7']
+    assert result['inventory'] == {}
+    assert client._trade_partner_cache == {'7': 123}
@@ -4,20 +4,20 @@
 """
 
 import os
-import pickle
 from pathlib import Path
 from src.steampy.client import SteamClient
+from src.utils.cookies_and_session import load_session_file
 
 def test_cookies_after_refresh():
     """Тест cookies после refresh token"""
     print("🔍 Тест cookies после refresh token...")
     
-    # Находим pkl файл
+    # Находим файл сессии
     accounts_dir = Path("accounts_info")
-    pkl_files = list(accounts_dir.glob("*.pkl"))
+    pkl_files = list(accounts_dir.glob("*.json"))
     
     if not pkl_files:
-        print("❌ Не найдены pkl файлы")
+        print("❌ Не найдены файлы сессий")
         return
     
     pkl_path = pkl_files[0]
@@ -25,8 +25,7 @@ def test_cookies_after_refresh():
     print(f"🎯 Тестируем аккаунт: {account_name}")
     
     # Загружаем сессию
-    with open(pkl_path, 'rb') as f:
-        session, refresh_token = pickle.load(f)
+    session, refresh_token = load_session_file(pkl_path)
     
     print(f"✅ Найден refresh token: {refresh_token[:20]}...")
     
@@ -2,24 +2,47 @@ import requests
 import json
 import secrets
 import base64
+from functools import lru_cache
+from http.cookies import SimpleCookie
 
 STEAM_LOGIN_BASE = 'https://login.steampowered.com'
 STEAM_COMMUNITY = 'https://steamcommunity.com'
+_FINALIZE_LOGIN_HEADERS = {
+    'Origin': STEAM_COMMUNITY,
+    'Referer': f'{STEAM_COMMUNITY}/',
+}
+
+# Одна сессия на все обновления: TLS соединения с login/community остаются в пуле
+_login_session = None
+
+def _get_login_session() -> requests.Session:
+    """Возвращает общую сессию для входа (создается при первом вызове)"""
+    global _login_session
+    if _login_session is None:
+        _login_session = requests.Session()
+        _login_session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+        })
+    return _login_session
+
+@lru_cache(maxsize=256)
+def _decode_jwt_payload(token: str) -> dict:
+    """Декодирует payload JWT (результат кэшируется по строке токена)"""
+    payload = token.split('.')[1]
+    # base64url без выравнивания: добавляем ровно столько '=', сколько нужно
+    return json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
 
 def extract_steam_id(refresh_token: str) -> str:
     """Извлекает SteamID из JWT токена"""
-    parts = refresh_token.split('.')
-    payload = json.loads(base64.b64decode(parts[1] + '=='))
-    return payload['sub']
+    return _decode_jwt_payload(refresh_token)['sub']
 
 def get_steam_login_cookies(refresh_token: str) -> dict:
     """
     Получает только steamLoginSecure и sessionid - минимум для работы со Steam
     """
-    session = requests.Session()
-    session.headers.update({
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-    })
+    session = _get_login_session()
+    # Соединения переиспользуем, а cookies предыдущего токена - нет
+    session.cookies.clear()
     
     session_id = secrets.token_hex(12)
     
@@ -31,10 +54,7 @@ def get_steam_login_cookies(refresh_token: str) -> dict:
             'sessionid': session_id,
             'redir': f'{STEAM_COMMUNITY}/login/home/?goto='
         },
-        headers={
-            'Origin': STEAM_COMMUNITY,
-            'Referer': f'{STEAM_COMMUNITY}/',
-        }
+        headers=_FINALIZE_LOGIN_HEADERS
     )
     
     result = resp.json()
@@ -45,35 +65,37 @@ def get_steam_login_cookies(refresh_token: str) -> dict:
     steam_id = extract_steam_id(refresh_token)
     transfer = result['transfer_info'][0]  # Берем первый
     
+    # Нужны только Set-Cookie этого ответа: без редиректа соединение сразу возвращается в пул
     tr_resp = session.post(
         transfer['url'],
-        data={'steamID': steam_id, **transfer['params']}
+        data={'steamID': steam_id, **transfer['params']},
+        allow_redirects=False
     )
     
-    # Шаг 3: Извлекаем steamLoginSecure из Set-Cookie
-    steam_login_secure = None
-    try:
-        cookies = tr_resp.raw._original_response.msg.get_all('Set-Cookie') or []
-        for cookie in cookies:
-            if 'steamLoginSecure=' in cookie:
-                steam_login_secure = cookie.split('steamLoginSecure=')[1].split(';')[0]
-                break
-    except:
-        raise Exception("Не удалось получить steamLoginSecure")
+    # Шаг 3: Извлекаем steamLoginSecure из Set-Cookie (все заголовки, без разбора строк вручную)
+    jar = SimpleCookie()
+    for header in tr_resp.raw.headers.getlist('Set-Cookie'):
+        jar.load(header)
     
-    if not steam_login_secure:
+    morsel = jar.get('steamLoginSecure')
+    if morsel is None or not morsel.value:
         raise Exception("steamLoginSecure не найден в ответе")
+    steam_login_secure = morsel.value
     
     return {
         'steamLoginSecure': steam_login_secure,
         'sessionid': session_id
     }
 
+# Шаблоны Set-Cookie для двух куки; format подставляет только значение и домен
+_STEAM_LOGIN_SECURE_TMPL = 'steamLoginSecure={value}; Path=/; Secure; HttpOnly; Domain={domain}'.format
+_SESSIONID_TMPL = 'sessionid={value}; Path=/; Secure; Domain={domain}'.format
+
 def format_cookies_for_domain(cookies_dict: dict, domain: str) -> list[str]:
     """Форматирует куки для конкретного домена"""
     return [
-        f"steamLoginSecure={cookies_dict['steamLoginSecure']}; Path=/; Secure; HttpOnly; Domain={domain}",
-        f"sessionid={cookies_dict['sessionid']}; Path=/; Secure; Domain={domain}"
+        _STEAM_LOGIN_SECURE_TMPL(value=cookies_dict['steamLoginSecure'], domain=domain),
+        _SESSIONID_TMPL(value=cookies_dict['sessionid'], domain=domain)
     ]
 
 # Пример использования
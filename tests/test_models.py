@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Тест разбора ответа GetTradeOffers в pydantic модели
+"""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from src.models import TradeOffersResponse, TradeOfferState
+
+
+def _offer(tradeofferid: str, state: int, is_our_offer: bool = False, confirmation_method: int = 0, **extra) -> dict:
+    offer = {
+        "tradeofferid": tradeofferid,
+        "accountid_other": 123456,
+        "trade_offer_state": state,
+        "is_our_offer": is_our_offer,
+        "time_created": 1753056725,
+        "time_updated": 1753056725,
+        "confirmation_method": confirmation_method,
+    }
+    offer.update(extra)
+    return offer
+
+
+RAW_RESPONSE = json.dumps({
+    "response": {
+        "trade_offers_received": [
+            _offer("1", 2, items_to_receive=[{
+                "appid": 730, "contextid": "2", "assetid": "10", "classid": "20", "instanceid": "0", "amount": "1"
+            }]),
+            _offer("2", 2, confirmation_method=2),
+            _offer("3", 3),
+        ],
+        "trade_offers_sent": [
+            _offer("4", 9, is_our_offer=True),
+            _offer("5", 2, is_our_offer=True),
+        ],
+        "next_cursor": 0,
+    }
+}).encode()
+
+
+def test_parse_trade_offers_from_bytes():
+    trade_offers = TradeOffersResponse.from_bytes(RAW_RESPONSE)
+
+    assert len(trade_offers.trade_offers_received) == 3
+    assert trade_offers.trade_offers_received[0].trade_offer_state == TradeOfferState.ACTIVE
+    assert trade_offers.trade_offers_received[0].items_to_receive_count == 1
+    assert trade_offers.trade_offers_received[0].items_to_give_count == 0
+
+    assert [o.tradeofferid for o in trade_offers.active_received] == ["1", "2"]
+    assert [o.tradeofferid for o in trade_offers.active_sent] == ["5"]
+    assert [o.tradeofferid for o in trade_offers.confirmation_needed_received] == ["2"]
+    assert [o.tradeofferid for o in trade_offers.confirmation_needed_sent] == ["4"]
+    assert trade_offers.total_active_offers == 3
+    assert trade_offers.total_confirmation_needed == 2
+    assert trade_offers.any_active_received
+
+
+def test_parse_empty_response():
+    trade_offers = TradeOffersResponse.from_bytes(b'{"response": {}}')
+
+    assert trade_offers.trade_offers_received == []
+    assert trade_offers.total_active_offers == 0
+    assert not trade_offers.any_active_received
+
+
+def test_response_is_frozen():
+    trade_offers = TradeOffersResponse.from_bytes(RAW_RESPONSE)
+    assert trade_offers.total_active_offers == 3
+
+    with pytest.raises(ValidationError):
+        trade_offers.trade_offers_received = []
+    assert trade_offers.total_active_offers == 3
+
+
+if __name__ == "__main__":
+    test_parse_trade_offers_from_bytes()
+    test_parse_empty_response()
+    test_response_is_frozen()
@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Тест разбора строк прокси в JsonProxyProvider
+"""
+
+from src.implementations.proxy_storage.json_proxy.provider import JsonProxyProvider
+
+
+def test_parse_host_port_user_password():
+    proxy = JsonProxyProvider._parse_proxy("http://1.2.3.4:8080:user:pa:ss")
+
+    assert proxy == {
+        'http': "http://user:pa:ss@1.2.3.4:8080",
+        'https': "http://user:pa:ss@1.2.3.4:8080",
+    }
+
+
+def test_parse_passthrough_and_no_proxy():
+    assert JsonProxyProvider._parse_proxy("http://1.2.3.4:8080") == {
+        'http': "http://1.2.3.4:8080",
+        'https': "http://1.2.3.4:8080",
+    }
+    assert JsonProxyProvider._parse_proxy("no_proxy") is None
+    assert JsonProxyProvider._parse_proxy("") is None
+
+
+if __name__ == "__main__":
+    test_parse_host_port_user_password()
+    test_parse_passthrough_and_no_proxy()
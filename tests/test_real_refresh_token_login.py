@@ -4,9 +4,9 @@
 """
 
 import os
-import pickle
 from pathlib import Path
 from src.steampy.client import SteamClient
+from src.utils.cookies_and_session import load_session_file
 from src.utils.delayed_http_adapter import DelayedHTTPAdapter
 from src.implementations.cookie_storage.sql_storage import SqlAlchemyCookieStorage
 
@@ -30,8 +30,7 @@ def test_real_refresh_token_login():
     
     # Загружаем данные из pkl файла
     try:
-        with open(pkl_path, 'rb') as f:
-            session_data = pickle.load(f)
+        session_data = load_session_file(pkl_path)
         
         if isinstance(session_data, tuple):
             session, refresh_token = session_data
@@ -4,8 +4,8 @@
 """
 
 import os
-import pickle
 from src.steampy.client import SteamClient
+from src.utils.cookies_and_session import load_session_file
 from src.utils.delayed_http_adapter import DelayedHTTPAdapter
 
 def test_refresh_token_force():
@@ -23,8 +23,7 @@ def test_refresh_token_force():
     print(f"✅ Найден pkl файл: {pkl_path}")
     
     # Загружаем данные из pkl файла
-    with open(pkl_path, 'rb') as f:
-        session_data = pickle.load(f)
+    session_data = load_session_file(pkl_path)
     
     if isinstance(session_data, tuple):
         session, refresh_token = session_data
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Тест разбора страницы трейда: партнер, баннер нового устройства и escrow
+"""
+
+from unittest import mock
+
+import pytest
+
+from src.steampy.client import SteamClient
+from src.steampy.exceptions import SevenDaysHoldException
+
+PARTNER_ID = b"var g_ulTradePartnerSteamID = '76561198000000001';"
+BANNER = b'You have logged in from a new device. In order to protect the items in your inventory'
+
+
+def _make_client(page: bytes, chunk_size: int = 7) -> SteamClient:
+    client = SteamClient.__new__(SteamClient)
+    client.was_login_executed = True
+    response = mock.MagicMock(content=page)
+    response.__enter__.return_value = response
+    response.iter_content.side_effect = lambda size: (page[i:i + chunk_size] for i in range(0, len(page), chunk_size))
+    client._session = mock.Mock()
+    client._session.get.return_value = response
+    return client
+
+
+def test_partner_id():
+    client = _make_client(b'<html>' + PARTNER_ID + b'</html>')
+    assert client._fetch_trade_partner_id('1') == '76561198000000001'
+
+
+def test_banner_after_partner_id_raises():
+    client = _make_client(b'<script>' + PARTNER_ID + b'</script>' + b'x' * 100_000 + b'<div>' + BANNER + b'</div>')
+    with pytest.raises(SevenDaysHoldException):
+        client._fetch_trade_partner_id('1')
+
+
+def test_escrow_duration_split_across_chunks():
+    page = b'var g_daysMyEscrow = 15;' + b'y' * 10_000 + b'var g_daysTheirEscrow = 3;'
+    client = _make_client(page, chunk_size=5)
+    assert client.get_escrow_duration('https://steamcommunity.com/tradeoffer/new/?partner=1&token=t') == 15
+
+
+def _make_accept_client(page: bytes, accept_body: bytes) -> SteamClient:
+    client = _make_client(page)
+    client._session.post.return_value = mock.Mock(content=accept_body)
+    client._get_session_id = mock.Mock(return_value='sid')
+    client._trade_partner_cache = {'1': '39734273'}
+    return client
+
+
+def test_cached_accept_raises_on_hold():
+    client = _make_accept_client(b'<div>' + BANNER + b'</div>', b'{"strError": "There was an error accepting this trade offer."}')
+    with pytest.raises(SevenDaysHoldException):
+        client.accept_trade_offer('1')
+
+
+def test_cached_accept_skips_trade_page():
+    client = _make_accept_client(b'<div>' + BANNER + b'</div>', b'{"tradeid": "42"}')
+    assert client.accept_trade_offer('1') == {'tradeid': '42'}
+    client._session.get.assert_not_called()
+    assert client._session.post.call_args.kwargs['data']['partner'] == '76561198000000001'